@@ -25,8 +25,24 @@ class AuthenticationError(EmailClientError):
 
 
 class EmailMessage:
-    """Data class representing an email message."""
-    
+    """Data class representing an email message.
+
+    Uses __slots__ so bulk operations (e.g. syncing thousands of messages)
+    avoid the per-instance __dict__ overhead and get faster attribute access.
+    """
+
+    __slots__ = (
+        "id",
+        "subject",
+        "sender",
+        "recipient",
+        "body",
+        "timestamp",
+        "is_read",
+        "folder",
+        "attachments",
+    )
+
     def __init__(
         self,
         id: str,
@@ -87,7 +103,11 @@ class EmailClient(ABC):
     This interface defines the contract that all email client implementations
     must follow, ensuring consistency across different email service providers.
     """
-    
+
+    # Empty slots keep the base class from forcing a __dict__ onto
+    # implementations that opt into __slots__ themselves.
+    __slots__ = ()
+
     @abstractmethod
     def send_email(self, recipient: str, subject: str, body: str) -> bool:
         """Send an email to a recipient.
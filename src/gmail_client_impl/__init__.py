@@ -5,28 +5,42 @@ using Google's Gmail API for email operations.
 """
 
 import base64
-import json
+import binascii
 import logging
 import os
-from datetime import datetime
+import queue
+import random
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+import httplib2
+import requests
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-
-# Import from the parent email_client_api
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from googleapiclient.model import JsonModel
+from requests.adapters import HTTPAdapter
 
 from email_client_api import EmailClient, EmailMessage, AuthenticationError, EmailClientError
 
+try:  # Optional speedup: ~3x faster JSON handling on large payloads
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 __version__ = "0.1.0"
-__all__ = ["GmailClient"]
+__all__ = ["EmailMessageProxy", "GmailClient"]
 
 # Gmail API scopes required for the operations
 SCOPES = [
@@ -35,10 +49,172 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.modify"
 ]
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One pooled session for token refreshes so repeated refreshes in a
+# long-running process reuse a keep-alive connection to the token endpoint
+_AUTH_SESSION = requests.Session()
+_AUTH_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_REFRESH_TRANSPORT = Request(session=_AUTH_SESSION)
+
+# Gmail caps batch requests at 100 sub-requests
+_BATCH_SIZE = 100
+
+# Refresh credentials this long before they actually expire
+_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Concurrent message fetches; keeps us well under Gmail's 250 quota-units/sec
+# (a messages.get costs 5 units, so 10 in flight is a comfortable margin)
+_MAX_PARALLEL_FETCHES = 10
+
+# Parsed messages kept per client, keyed by (message id, historyId)
+_PARSE_CACHE_SIZE = 4096
+
+# Sanity check for recipient addresses before hitting the API
+_RECIPIENT_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Maps base64url alphabet to the standard one for binascii decoding
+_URLSAFE_TRANS = bytes.maketrans(b"-_", b"+/")
+
+# Gmail caps a single messages().list() page at 500 results
+_MAX_PAGE_SIZE = 500
+
+# Labels change rarely; serve get_folders from cache for this many seconds
+_FOLDERS_CACHE_TTL = 300.0
+
+# Gmail caps batchDelete/batchModify at 1000 IDs per request
+_BULK_IDS_LIMIT = 1000
+
+# Folder name -> prebuilt "in:..." query clause
+_folder_query_cache: Dict[str, str] = {}
+
+
+def _format_timestamp(ms_epoch: int) -> str:
+    """Format a millisecond epoch as an ISO 8601 UTC string.
+
+    Formats via divmod and time.gmtime rather than allocating a datetime
+    (plus tz lookup) per message, which is CPU-visible when parsing
+    thousands of messages.
+
+    Args:
+        ms_epoch: Milliseconds since the Unix epoch (Gmail internalDate)
+
+    Returns:
+        Timestamp like "2022-01-01T00:00:00.000+00:00"
+    """
+    seconds, ms = divmod(ms_epoch, 1000)
+    tup = time.gmtime(seconds)
+    return (
+        f"{tup.tm_year:04d}-{tup.tm_mon:02d}-{tup.tm_mday:02d}"
+        f"T{tup.tm_hour:02d}:{tup.tm_min:02d}:{tup.tm_sec:02d}"
+        f".{ms:03d}+00:00"
+    )
+
+
+def _folder_query(folder: str) -> str:
+    """Return the Gmail query clause for a folder, quoting when needed.
+
+    Custom labels containing spaces or colons would otherwise produce
+    malformed queries; quoting once and caching avoids both the breakage
+    and rebuilding the clause per call.
+
+    Args:
+        folder: Raw folder/label name
+
+    Returns:
+        A query clause like 'in:inbox' or 'in:"my label"'
+    """
+    cached = _folder_query_cache.get(folder)
+    if cached is None:
+        name = folder.lower()
+        if " " in name or ":" in name:
+            cached = 'in:"{}"'.format(name.replace('"', '\\"'))
+        else:
+            cached = f"in:{name}"
+        _folder_query_cache[folder] = cached
+    return cached
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel variant that (de)serializes through orjson.
+
+    Gmail message payloads are deeply nested, and orjson decodes them
+    several times faster than the stdlib json module, which matters on the
+    bulk-fetch path where a 100-message batch arrives as one large body.
+    """
+
+    def serialize(self, body_value: Any) -> str:
+        """Serialize a request body to JSON."""
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+        return orjson.dumps(body_value).decode("utf-8")
+
+    def deserialize(self, content: Any) -> Any:
+        """Deserialize a response body from JSON."""
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            try:
+                return content.decode("utf-8")
+            except AttributeError:
+                return content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+class EmailMessageProxy:
+    """Lazy stand-in for an EmailMessage backed by a Gmail message ID.
+
+    The proxy is created from a messages().list() entry without fetching the
+    full payload. The first access to any EmailMessage attribute (body,
+    subject, sender, ...) triggers a single messages().get() call and the
+    result is cached, so listing workflows that never touch message content
+    skip the per-message fetch entirely.
+    """
+
+    __slots__ = ("id", "_client_ref", "_message")
+
+    def __init__(self, client: "GmailClient", message_id: str) -> None:
+        """Initialize the proxy.
+
+        Args:
+            client: GmailClient used to fetch the message on first access
+            message_id: Gmail message ID this proxy represents
+        """
+        self.id = message_id
+        self._client_ref = weakref.ref(client)
+        self._message = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Fetch and cache the full message on first attribute access.
+
+        Args:
+            name: Attribute being accessed (e.g. "body", "subject")
+
+        Returns:
+            The attribute value from the fetched EmailMessage
+
+        Raises:
+            EmailClientError: If the backing client is gone or the fetch fails
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if self._message is None:
+            client = self._client_ref()
+            if client is None:
+                raise EmailClientError(
+                    f"Cannot fetch message {self.id}: client no longer available"
+                )
+            self._message = client._fetch_message(self.id)
+
+        return getattr(self._message, name)
+
 
 class GmailClient(EmailClient):
     """Gmail implementation of the EmailClient interface.
@@ -65,6 +241,10 @@ class GmailClient(EmailClient):
         self.scopes = scopes or SCOPES
         self.service: Any = None
         self.credentials: Optional[Credentials] = None
+        self._fetch_semaphore = threading.Semaphore(_MAX_PARALLEL_FETCHES)
+        self._local = threading.local()
+        self._parse_cache: "OrderedDict[tuple[str, str], EmailMessage]" = OrderedDict()
+        self._folders_cache: Optional[tuple[List[str], float]] = None
         
         logger.info("GmailClient initialized")
     
@@ -90,10 +270,10 @@ class GmailClient(EmailClient):
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
                     try:
-                        creds.refresh(Request())
+                        creds.refresh(_REFRESH_TRANSPORT)
                         logger.info("Access token refreshed successfully")
                     except Exception as e:
-                        logger.warning(f"Token refresh failed: {e}")
+                        logger.warning("Token refresh failed: %s", e)
                         creds = None
                 
                 if not creds:
@@ -113,14 +293,83 @@ class GmailClient(EmailClient):
                     token.write(creds.to_json())
             
             self.credentials = creds
-            self.service = build("gmail", "v1", credentials=creds)
+            # Reuse one keep-alive transport for the serial call paths so
+            # each .execute() does not pay a fresh TCP+TLS handshake.
+            # httplib2.Http is not thread-safe; anything that executes off
+            # the calling thread must go through _thread_http() instead
+            authed_http = AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
+            build_kwargs: Dict[str, Any] = {
+                "http": authed_http,
+                "cache_discovery": False,
+                "static_discovery": True,
+            }
+            if orjson is not None:
+                build_kwargs["model"] = _OrjsonModel()
+            self.service = build("gmail", "v1", **build_kwargs)
             logger.info("Gmail service initialized successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Authentication failed: {e}")
             raise AuthenticationError(f"Gmail authentication failed: {e}") from e
     
+    def _ensure_fresh_credentials(self) -> None:
+        """Proactively refresh credentials that are close to expiry.
+
+        Refreshing when less than _REFRESH_MARGIN of validity remains avoids
+        a synchronous refresh stall on the first API call after expiry
+        (often in the middle of a batch). The refreshed token is persisted
+        from a background thread so the call path is not delayed by disk I/O.
+        """
+        creds = self.credentials
+        if creds is None or not getattr(creds, "refresh_token", None):
+            return
+
+        expiry = getattr(creds, "expiry", None)
+        if not isinstance(expiry, datetime):
+            return
+        if expiry.tzinfo is None:
+            # google-auth stores expiry as naive UTC
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        if expiry - datetime.now(timezone.utc) > _REFRESH_MARGIN:
+            return
+
+        try:
+            creds.refresh(_REFRESH_TRANSPORT)
+            logger.info("Credentials refreshed proactively")
+        except Exception as e:
+            logger.warning("Proactive credential refresh failed: %s", e)
+            return
+
+        threading.Thread(target=self._persist_token, daemon=True).start()
+
+    def _persist_token(self) -> None:
+        """Write the current credentials to the token file."""
+        if self.credentials is None:
+            return
+        try:
+            with open(self.token_file, "w", encoding="utf-8") as token:
+                token.write(self.credentials.to_json())
+        except OSError as e:
+            logger.warning("Failed to persist refreshed token: %s", e)
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Return an AuthorizedHttp owned by the calling thread.
+
+        httplib2.Http is not thread-safe, so the pooled transport built in
+        authenticate() must never be shared across threads. Each worker
+        thread gets its own keep-alive connection here, created on first
+        use and reused for that thread's lifetime (and rebuilt if the
+        client re-authenticates with new credentials).
+
+        Returns:
+            AuthorizedHttp bound to the current credentials
+        """
+        http = getattr(self._local, "http", None)
+        if http is None or getattr(http, "credentials", None) is not self.credentials:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=30))
+            self._local.http = http
+        return http
+
     def send_email(self, recipient: str, subject: str, body: str) -> bool:
         """Send an email using Gmail API.
         
@@ -138,91 +387,145 @@ class GmailClient(EmailClient):
         """
         if not self.service:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
         
+        if not _RECIPIENT_RE.match(recipient):
+            raise EmailClientError(f"Invalid recipient address: {recipient}")
+
         try:
-            # Create message
-            message = MIMEMultipart()
-            message["to"] = recipient
-            message["subject"] = subject
-            
-            # Add body
-            message.attach(MIMEText(body, "plain"))
-            
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(
-                message.as_bytes()
-            ).decode("utf-8")
-            
             # Send message
-            send_message = {"raw": raw_message}
+            send_message = {"raw": self._build_raw_message(recipient, subject, body)}
             result = self.service.users().messages().send(
                 userId="me", body=send_message
             ).execute()
             
-            logger.info(f"Email sent successfully. Message ID: {result.get('id')}")
+            logger.info("Email sent successfully. Message ID: %s", result.get("id"))
             return True
             
         except HttpError as e:
-            logger.error(f"HTTP error sending email: {e}")
             raise EmailClientError(f"Failed to send email: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error sending email: {e}")
             raise EmailClientError(f"Failed to send email: {e}") from e
     
+    def _build_raw_message(self, recipient: str, subject: str, body: str) -> str:
+        """Build the base64url-encoded RFC 2822 message for sending.
+
+        A plain-text message with ASCII headers is assembled from a direct
+        string template, which avoids the email.mime state machine and its
+        per-call allocations. Headers that need RFC 2047 encoding fall back
+        to the MIME classes.
+
+        Args:
+            recipient: Email address of the recipient
+            subject: Subject line of the email
+            body: Email body content
+
+        Returns:
+            Base64url-encoded message ready for the Gmail send API
+        """
+        if recipient.isascii() and subject.isascii():
+            raw = (
+                f"To: {recipient}\r\n"
+                f"Subject: {subject}\r\n"
+                "MIME-Version: 1.0\r\n"
+                "Content-Type: text/plain; charset=utf-8\r\n"
+                "Content-Transfer-Encoding: 8bit\r\n"
+                f"\r\n{body}"
+            ).encode("utf-8")
+        else:
+            message = MIMEMultipart()
+            message["to"] = recipient
+            message["subject"] = subject
+            message.attach(MIMEText(body, "plain"))
+            raw = message.as_bytes()
+
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
     def retrieve_emails(
-        self, 
-        folder: str = "INBOX", 
-        limit: int = 10
+        self,
+        folder: str = "INBOX",
+        limit: int = 10,
+        *,
+        lazy: bool = False,
+        fetch_body: bool = False,
     ) -> List[EmailMessage]:
         """Retrieve emails from Gmail.
-        
+
         Args:
             folder: Gmail label to retrieve from (default: "INBOX")
             limit: Maximum number of emails to retrieve (default: 10)
-            
+            lazy: If True, return EmailMessageProxy objects that defer the
+                per-message fetch until an attribute is accessed
+            fetch_body: If True, fetch the full message payload including
+                bodies; by default only listing metadata is requested and
+                body is set to "", which is 5-50x less data on the wire
+
         Returns:
-            List[EmailMessage]: List of email message objects
-            
+            List[EmailMessage]: List of email message objects (or lazy
+                proxies that behave like them when lazy=True)
+
         Raises:
             AuthenticationError: If not authenticated
             EmailClientError: If email retrieval fails
         """
         if not self.service:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
-        
+
+        self._ensure_fresh_credentials()
+
         try:
-            # Get list of messages
-            query = f"in:{folder.lower()}"
-            result = self.service.users().messages().list(
-                userId="me", q=query, maxResults=limit
-            ).execute()
-            
-            messages = result.get("messages", [])
-            email_list = []
-            
-            for message in messages:
-                try:
-                    # Get full message details
-                    msg = self.service.users().messages().get(
-                        userId="me", id=message["id"]
-                    ).execute()
-                    
-                    email_obj = self._parse_gmail_message(msg)
-                    if email_obj:
-                        email_list.append(email_obj)
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to parse message {message['id']}: {e}")
-                    continue
-            
-            logger.info(f"Retrieved {len(email_list)} emails from {folder}")
+            # Produce id pages in the background so the next list() round-trip
+            # overlaps with the batch fetch of the previous page
+            query = _folder_query(folder)
+            id_queue: "queue.Queue[Any]" = queue.Queue(maxsize=2)
+            stop = threading.Event()
+            producer = threading.Thread(
+                target=self._produce_message_ids,
+                args=(query, limit, id_queue, stop),
+                daemon=True,
+            )
+            producer.start()
+
+            email_list: List[EmailMessage] = []
+            proxies: List[EmailMessageProxy] = []
+            try:
+                while True:
+                    item = id_queue.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    if lazy:
+                        # Skip per-message get() entirely; proxies fetch on
+                        # demand
+                        proxies.extend(
+                            EmailMessageProxy(self, mid) for mid in item
+                        )
+                    else:
+                        email_list.extend(
+                            self._batch_fetch_messages(item, fetch_body=fetch_body)
+                        )
+            except Exception:
+                # Unblock a producer stuck in put() and consume its sentinel
+                # so the thread is never leaked on the error path
+                stop.set()
+                while id_queue.get() is not None:
+                    pass
+                producer.join()
+                raise
+            producer.join()
+
+            if lazy:
+                logger.info("Prepared %d lazy proxies from %s", len(proxies), folder)
+                return proxies  # type: ignore[return-value]
+
+            logger.info("Retrieved %d emails from %s", len(email_list), folder)
             return email_list
             
         except HttpError as e:
-            logger.error(f"HTTP error retrieving emails: {e}")
             raise EmailClientError(f"Failed to retrieve emails: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error retrieving emails: {e}")
             raise EmailClientError(f"Failed to retrieve emails: {e}") from e
     
     def delete_email(self, email_id: str) -> bool:
@@ -240,23 +543,24 @@ class GmailClient(EmailClient):
         """
         if not self.service:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
         
         try:
             self.service.users().messages().delete(
                 userId="me", id=email_id
             ).execute()
             
-            logger.info(f"Email deleted successfully: {email_id}")
+            self._invalidate_parse_cache(email_id)
+            logger.info("Email deleted successfully: %s", email_id)
             return True
             
         except HttpError as e:
             if e.resp.status == 404:
-                logger.warning(f"Email not found for deletion: {email_id}")
+                logger.warning("Email not found for deletion: %s", email_id)
                 return False
-            logger.error(f"HTTP error deleting email: {e}")
             raise EmailClientError(f"Failed to delete email: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error deleting email: {e}")
             raise EmailClientError(f"Failed to delete email: {e}") from e
     
     def mark_as_read(self, email_id: str) -> bool:
@@ -274,6 +578,8 @@ class GmailClient(EmailClient):
         """
         if not self.service:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
         
         try:
             # Remove UNREAD label to mark as read
@@ -283,19 +589,459 @@ class GmailClient(EmailClient):
                 body={"removeLabelIds": ["UNREAD"]}
             ).execute()
             
-            logger.info(f"Email marked as read: {email_id}")
+            self._invalidate_parse_cache(email_id)
+            logger.info("Email marked as read: %s", email_id)
             return True
             
         except HttpError as e:
             if e.resp.status == 404:
-                logger.warning(f"Email not found for marking as read: {email_id}")
+                logger.warning("Email not found for marking as read: %s", email_id)
                 return False
-            logger.error(f"HTTP error marking email as read: {e}")
             raise EmailClientError(f"Failed to mark email as read: {e}") from e
         except Exception as e:
-            logger.error(f"Unexpected error marking email as read: {e}")
             raise EmailClientError(f"Failed to mark email as read: {e}") from e
-    
+
+    def delete_emails(self, email_ids: List[str]) -> bool:
+        """Delete multiple emails in bulk.
+
+        Uses the batchDelete endpoint, which accepts up to 1000 IDs per
+        request, so deleting N emails costs ceil(N / 1000) round-trips
+        instead of N. Prefer this over looping delete_email().
+
+        Args:
+            email_ids: Gmail message IDs to delete
+
+        Returns:
+            bool: True if all emails were deleted successfully
+
+        Raises:
+            AuthenticationError: If not authenticated
+            EmailClientError: If bulk deletion fails
+        """
+        if not self.service:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
+
+        try:
+            for start in range(0, len(email_ids), _BULK_IDS_LIMIT):
+                chunk = email_ids[start:start + _BULK_IDS_LIMIT]
+                self.service.users().messages().batchDelete(
+                    userId="me", body={"ids": chunk}
+                ).execute()
+                for email_id in chunk:
+                    self._invalidate_parse_cache(email_id)
+
+            logger.info("Deleted %d emails in bulk", len(email_ids))
+            return True
+
+        except HttpError as e:
+            raise EmailClientError(f"Failed to delete emails: {e}") from e
+        except Exception as e:
+            raise EmailClientError(f"Failed to delete emails: {e}") from e
+
+    def mark_as_read_bulk(self, email_ids: List[str]) -> bool:
+        """Mark multiple emails as read in bulk.
+
+        Uses the batchModify endpoint (up to 1000 IDs per request) to
+        remove the UNREAD label in one round-trip per chunk rather than
+        one per message.
+
+        Args:
+            email_ids: Gmail message IDs to mark as read
+
+        Returns:
+            bool: True if all emails were marked as read successfully
+
+        Raises:
+            AuthenticationError: If not authenticated
+            EmailClientError: If the bulk modification fails
+        """
+        if not self.service:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
+
+        try:
+            for start in range(0, len(email_ids), _BULK_IDS_LIMIT):
+                chunk = email_ids[start:start + _BULK_IDS_LIMIT]
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={"ids": chunk, "removeLabelIds": ["UNREAD"]}
+                ).execute()
+                for email_id in chunk:
+                    self._invalidate_parse_cache(email_id)
+
+            logger.info("Marked %d emails as read in bulk", len(email_ids))
+            return True
+
+        except HttpError as e:
+            raise EmailClientError(f"Failed to mark emails as read: {e}") from e
+        except Exception as e:
+            raise EmailClientError(f"Failed to mark emails as read: {e}") from e
+
+    def search_messages(
+        self,
+        query: str,
+        folder: str = "INBOX",
+        limit: int = 10,
+        *,
+        fetch_body: bool = False,
+    ) -> Iterator[EmailMessage]:
+        """Search Gmail and stream matching messages as they are fetched.
+
+        Messages are fetched through the batch HTTP endpoint (one round-trip
+        per _BATCH_SIZE IDs) and yielded as each batch completes, keeping
+        memory bounded while amortizing the per-message get() cost.
+
+        Args:
+            query: Gmail search query (e.g. "from:alice subject:report")
+            folder: Gmail label to search in (default: "INBOX")
+            limit: Maximum number of messages to return (default: 10)
+            fetch_body: If False, request metadata format with a header
+                allowlist, cutting response size when bodies are not needed
+
+        Returns:
+            Iterator[EmailMessage]: Matching messages in batch completion
+                order
+
+        Raises:
+            AuthenticationError: If not authenticated
+            EmailClientError: If the search request fails
+        """
+        # Plain method, not a generator: the auth guard and the initial
+        # list() run at call time like every other public method, and only
+        # the batch fetching is deferred to iteration
+        if not self.service:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
+
+        try:
+            full_query = f"{_folder_query(folder)} {query}"
+            result = self.service.users().messages().list(
+                userId="me",
+                q=full_query,
+                maxResults=limit,
+                fields="messages/id,nextPageToken",
+            ).execute()
+            messages = result.get("messages", [])
+        except HttpError as e:
+            raise EmailClientError(f"Failed to search messages: {e}") from e
+
+        return self._stream_search_results(messages, fetch_body=fetch_body)
+
+    def _stream_search_results(
+        self,
+        messages: List[Dict[str, Any]],
+        *,
+        fetch_body: bool,
+    ) -> Iterator[EmailMessage]:
+        """Batch-fetch listed messages and yield them as batches complete.
+
+        Streaming body of search_messages; assumes the caller has already
+        validated authentication.
+
+        Args:
+            messages: Message stubs (with "id") from messages().list()
+            fetch_body: If True, fetch full payloads and parse bodies
+
+        Yields:
+            EmailMessage: Matching messages in batch completion order
+        """
+        pending: deque = deque()
+
+        def _collect(
+            request_id: str,
+            response: Optional[Dict[str, Any]],
+            exception: Optional[Exception],
+        ) -> None:
+            if exception is not None:
+                logger.warning("Failed to fetch message %s: %s", request_id, exception)
+                return
+            if fetch_body:
+                email_obj = self._parse_gmail_message(response)
+            else:
+                email_obj = self._parse_metadata_only(response)
+            if email_obj:
+                pending.append(email_obj)
+
+        for start in range(0, len(messages), _BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for message in messages[start:start + _BATCH_SIZE]:
+                get_kwargs: Dict[str, Any] = {"userId": "me", "id": message["id"]}
+                if not fetch_body:
+                    get_kwargs["format"] = "metadata"
+                    get_kwargs["metadataHeaders"] = ["Subject", "From", "To"]
+                batch.add(
+                    self.service.users().messages().get(**get_kwargs),
+                    request_id=message["id"],
+                )
+            try:
+                batch.execute()
+            except HttpError as e:
+                raise EmailClientError(f"Failed to search messages: {e}") from e
+
+            while pending:
+                yield pending.popleft()
+
+    def _produce_message_ids(
+        self,
+        query: str,
+        limit: int,
+        id_queue: "queue.Queue[Any]",
+        stop: threading.Event,
+    ) -> None:
+        """List message IDs page by page and feed them to the fetch loop.
+
+        Runs in a background thread: each page of IDs is pushed to the
+        bounded queue (followed by None as a sentinel), so the consumer can
+        batch-fetch one page while the next list() round-trip is in flight.
+        list() executes on the thread-local transport since the consumer may
+        be driving the shared one concurrently. Errors are forwarded through
+        the queue for the consumer to raise; a set stop event means the
+        consumer failed and no more pages are wanted.
+
+        Args:
+            query: Gmail search query for messages().list()
+            limit: Total number of IDs to produce across pages
+            id_queue: Queue receiving List[str] pages, then None
+            stop: Event the consumer sets to abandon pagination early
+        """
+        try:
+            produced = 0
+            page_token: Optional[str] = None
+            while produced < limit and not stop.is_set():
+                list_kwargs: Dict[str, Any] = {
+                    "userId": "me",
+                    "q": query,
+                    "maxResults": min(limit - produced, _MAX_PAGE_SIZE),
+                    "fields": "messages/id,nextPageToken",
+                }
+                if page_token:
+                    list_kwargs["pageToken"] = page_token
+                result = self.service.users().messages().list(
+                    **list_kwargs
+                ).execute(http=self._thread_http())
+
+                ids = [m["id"] for m in result.get("messages", [])]
+                if not ids:
+                    break
+                produced += len(ids)
+                id_queue.put(ids)
+
+                page_token = result.get("nextPageToken")
+                if not page_token:
+                    break
+        except Exception as e:  # Forwarded to the consumer thread
+            id_queue.put(e)
+        finally:
+            id_queue.put(None)
+
+    def _batch_fetch_messages(
+        self,
+        message_ids: List[str],
+        *,
+        fetch_body: bool = False,
+    ) -> List[EmailMessage]:
+        """Fetch and parse messages using Gmail's batch HTTP endpoint.
+
+        Collapses the N per-message get() round-trips into one
+        multipart/mixed request per chunk of _BATCH_SIZE IDs. Individual
+        failures are handled inside the callback so one bad message does not
+        fail the whole batch. Unless fetch_body is True, sub-requests use
+        format=metadata with a header allowlist to shrink responses.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+            fetch_body: If False, request and parse only listing metadata
+
+        Returns:
+            List[EmailMessage]: Parsed messages, skipping any that failed
+        """
+        if fetch_body:
+            # Full payloads can push a 100-message batch response past the
+            # endpoint's size limits, so overlap individual gets instead
+            return self._parallel_fetch_messages(message_ids)
+
+        email_list: List[EmailMessage] = []
+
+        def _collect(
+            request_id: str,
+            response: Optional[Dict[str, Any]],
+            exception: Optional[Exception],
+        ) -> None:
+            if exception is not None:
+                logger.warning("Failed to fetch message %s: %s", request_id, exception)
+                return
+            email_obj = self._parse_metadata_only(response)
+            if email_obj:
+                email_list.append(email_obj)
+
+        for start in range(0, len(message_ids), _BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=_collect)
+            for message_id in message_ids[start:start + _BATCH_SIZE]:
+                batch.add(
+                    self.service.users().messages().get(
+                        userId="me",
+                        id=message_id,
+                        format="metadata",
+                        metadataHeaders=["Subject", "From", "To", "Date"],
+                    ),
+                    request_id=message_id,
+                )
+            batch.execute()
+
+        return email_list
+
+    def _parallel_fetch_messages(self, message_ids: List[str]) -> List[EmailMessage]:
+        """Fetch full messages concurrently with bounded parallelism.
+
+        Used for the full-body path, where batch responses would grow too
+        large. Up to _MAX_PARALLEL_FETCHES gets are kept in flight so network
+        latency overlaps instead of serializing. Results arrive in completion
+        order, not request order.
+
+        Args:
+            message_ids: Gmail message IDs to fetch
+
+        Returns:
+            List[EmailMessage]: Parsed messages, skipping any that failed
+        """
+        email_list: List[EmailMessage] = []
+
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_FETCHES) as executor:
+            futures = [
+                executor.submit(
+                    self._execute_with_retry,
+                    self.service.users().messages().get(userId="me", id=message_id),
+                )
+                for message_id in message_ids
+            ]
+            for future in as_completed(futures):
+                try:
+                    msg = future.result()
+                except HttpError as e:
+                    logger.warning("Failed to fetch message: %s", e)
+                    continue
+                email_obj = self._parse_gmail_message(msg)
+                if email_obj:
+                    email_list.append(email_obj)
+
+        return email_list
+
+    def _execute_with_retry(
+        self,
+        request: Any,
+        max_retries: int = 3,
+    ) -> Dict[str, Any]:
+        """Execute an API request, backing off on rate-limit responses.
+
+        Args:
+            request: Prepared googleapiclient request to execute
+            max_retries: Retries allowed for 429 responses before giving up
+
+        Returns:
+            The decoded API response
+
+        Raises:
+            HttpError: If the request fails with a non-429 status or retries
+                are exhausted
+        """
+        for attempt in range(max_retries + 1):
+            with self._fetch_semaphore:
+                try:
+                    # Runs on executor threads: use the thread-local
+                    # transport, never the shared service http
+                    return request.execute(http=self._thread_http())
+                except HttpError as e:
+                    if e.resp.status != 429 or attempt == max_retries:
+                        raise
+            delay = (2 ** attempt) + random.random()  # noqa: S311
+            logger.warning("Rate limited; retrying in %.1fs", delay)
+            time.sleep(delay)
+        raise EmailClientError("Retry loop exited unexpectedly")
+
+    def _fetch_message(self, email_id: str) -> EmailMessage:
+        """Fetch and parse a single message by ID.
+
+        Used by EmailMessageProxy to materialize a message on first access.
+
+        Args:
+            email_id: Gmail message ID to fetch
+
+        Returns:
+            Parsed EmailMessage object
+
+        Raises:
+            AuthenticationError: If not authenticated
+            EmailClientError: If the fetch or parse fails
+        """
+        if not self.service:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
+
+        try:
+            msg = self.service.users().messages().get(
+                userId="me", id=email_id
+            ).execute()
+        except HttpError as e:
+            raise EmailClientError(f"Failed to fetch email {email_id}: {e}") from e
+
+        email_obj = self._parse_gmail_message(msg)
+        if email_obj is None:
+            raise EmailClientError(f"Failed to parse email {email_id}")
+        return email_obj
+
+    def get_folders(self) -> List[str]:
+        """Return the names of all Gmail labels for the account.
+
+        Labels change rarely, so results are cached for _FOLDERS_CACHE_TTL
+        seconds; within that window this is a list copy instead of a
+        labels().list() round-trip.
+
+        Returns:
+            List[str]: Label names (e.g. "INBOX", "SENT", custom labels)
+
+        Raises:
+            AuthenticationError: If not authenticated
+            EmailClientError: If the label listing fails
+        """
+        if not self.service:
+            raise AuthenticationError("Not authenticated. Call authenticate() first.")
+
+        self._ensure_fresh_credentials()
+
+        now = time.monotonic()
+        if self._folders_cache is not None:
+            names, fetched_at = self._folders_cache
+            if now - fetched_at < _FOLDERS_CACHE_TTL:
+                return list(names)
+
+        try:
+            result = self.service.users().labels().list(
+                userId="me", fields="labels/name"
+            ).execute()
+
+            names = [label["name"] for label in result.get("labels", [])]
+            self._folders_cache = (names, now)
+            logger.info("Retrieved %d folders", len(names))
+            return list(names)
+
+        except HttpError as e:
+            raise EmailClientError(f"Failed to retrieve folders: {e}") from e
+
+    def _invalidate_parse_cache(self, email_id: str) -> None:
+        """Drop cached parses for a message after it is mutated.
+
+        Args:
+            email_id: Gmail message ID whose cache entries are stale
+        """
+        stale = [key for key in self._parse_cache if key[0] == email_id]
+        for key in stale:
+            del self._parse_cache[key]
+
     def _parse_gmail_message(self, msg: Dict[str, Any]) -> Optional[EmailMessage]:
         """Parse a Gmail API message into an EmailMessage object.
         
@@ -305,35 +1051,51 @@ class GmailClient(EmailClient):
         Returns:
             EmailMessage object or None if parsing fails
         """
+        # Unchanged messages (same id and historyId) skip the parse entirely
+        cache_key = (msg.get("id", ""), msg.get("historyId", ""))
+        if cache_key[1]:
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                self._parse_cache.move_to_end(cache_key)
+                return cached
+
         try:
-            headers = {h["name"]: h["value"] for h in msg["payload"]["headers"]}
-            
-            # Extract basic information
+            # Scan for just the three consumed headers rather than building a
+            # dict of all 30-60 the server may return; keyed by name so a
+            # duplicated header counts once and cannot end the scan early
+            found: Dict[str, str] = {}
+            for header in msg["payload"]["headers"]:
+                name = header["name"]
+                if name in ("Subject", "From", "To"):
+                    found[name] = header["value"]
+                    if len(found) == 3:
+                        break
+            subject = found.get("Subject", "No Subject")
+            sender = found.get("From", "Unknown Sender")
+            recipient = found.get("To", "Unknown Recipient")
+
             email_id = msg["id"]
-            subject = headers.get("Subject", "No Subject")
-            sender = headers.get("From", "Unknown Sender")
-            recipient = headers.get("To", "Unknown Recipient")
             
             # Parse timestamp
-            timestamp_ms = int(msg["internalDate"])
-            timestamp = datetime.fromtimestamp(timestamp_ms / 1000).isoformat()
+            timestamp = _format_timestamp(int(msg["internalDate"]))
             
-            # Check if read (UNREAD label present means unread)
-            is_read = "UNREAD" not in msg["labelIds"]
-            
-            # Determine folder from labels
-            folder = "INBOX"  # Default
-            if "INBOX" in msg["labelIds"]:
-                folder = "INBOX"
-            elif "SENT" in msg["labelIds"]:
-                folder = "SENT"
-            elif "DRAFT" in msg["labelIds"]:
-                folder = "DRAFT"
+            # Convert labels once; membership checks are then O(1) instead of
+            # rescanning the list for each candidate folder
+            labels = frozenset(msg["labelIds"])
+            is_read = "UNREAD" not in labels
+            folder = next(
+                (f for f in ("INBOX", "SENT", "DRAFT") if f in labels), "INBOX"
+            )
             
-            # Extract body (simplified - just get plain text)
-            body = self._extract_message_body(msg["payload"])
+            # Extract body (simplified - just get plain text); metadata-format
+            # responses carry no body data, so skip extraction entirely
+            payload = msg["payload"]
+            if "parts" in payload or payload.get("body", {}).get("data"):
+                body = self._extract_message_body(payload)
+            else:
+                body = ""
             
-            return EmailMessage(
+            email_obj = EmailMessage(
                 id=email_id,
                 subject=subject,
                 sender=sender,
@@ -344,11 +1106,71 @@ class GmailClient(EmailClient):
                 folder=folder,
                 attachments=[]  # TODO: Implement attachment parsing
             )
-            
-        except Exception as e:
-            logger.error(f"Failed to parse Gmail message: {e}")
+
+            if cache_key[1]:
+                self._parse_cache[cache_key] = email_obj
+                if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+
+            return email_obj
+
+        except (KeyError, ValueError, TypeError) as e:
+            # Expected data errors skip the traceback machinery; real bugs
+            # propagate to the caller instead of being swallowed here
+            logger.debug("Failed to parse Gmail message: %s", e)
             return None
     
+    def _parse_metadata_only(self, msg: Dict[str, Any]) -> Optional[EmailMessage]:
+        """Parse only the listing metadata of a Gmail API message.
+
+        Specialized fast path for listing views: scans just the three needed
+        headers and skips body extraction entirely, which is the dominant
+        parse cost for large messages.
+
+        Args:
+            msg: Gmail API message object
+
+        Returns:
+            EmailMessage with an empty body, or None if parsing fails
+        """
+        try:
+            # Keyed by name so a duplicated header counts once and cannot
+            # end the scan early
+            found: Dict[str, str] = {}
+            for header in msg["payload"]["headers"]:
+                name = header["name"]
+                if name in ("Subject", "From", "To"):
+                    found[name] = header["value"]
+                    if len(found) == 3:
+                        break
+            subject = found.get("Subject", "No Subject")
+            sender = found.get("From", "Unknown Sender")
+            recipient = found.get("To", "Unknown Recipient")
+
+            timestamp = _format_timestamp(int(msg["internalDate"]))
+
+            labels = frozenset(msg["labelIds"])
+            is_read = "UNREAD" not in labels
+            folder = next(
+                (f for f in ("INBOX", "SENT", "DRAFT") if f in labels), "INBOX"
+            )
+
+            return EmailMessage(
+                id=msg["id"],
+                subject=subject,
+                sender=sender,
+                recipient=recipient,
+                body="",
+                timestamp=timestamp,
+                is_read=is_read,
+                folder=folder,
+                attachments=[],
+            )
+
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug("Failed to parse Gmail message metadata: %s", e)
+            return None
+
     def _extract_message_body(self, payload: Dict[str, Any]) -> str:
         """Extract the body text from a Gmail message payload.
         
@@ -359,20 +1181,31 @@ class GmailClient(EmailClient):
             Extracted body text
         """
         try:
+            data = None
+
             # Handle multipart messages
             if "parts" in payload:
-                for part in payload["parts"]:
-                    if part["mimeType"] == "text/plain":
-                        data = part["body"]["data"]
-                        return base64.urlsafe_b64decode(data).decode("utf-8")
-            
+                part = next(
+                    (p for p in payload["parts"] if p["mimeType"] == "text/plain"),
+                    None,
+                )
+                if part is not None:
+                    data = part["body"]["data"]
+
             # Handle single part messages
             elif payload["mimeType"] == "text/plain":
                 data = payload["body"]["data"]
-                return base64.urlsafe_b64decode(data).decode("utf-8")
-            
-            return "No plain text content found"
-            
-        except Exception as e:
-            logger.warning(f"Failed to extract message body: {e}")
+
+            if data is None:
+                return "No plain text content found"
+
+            # Translate base64url in place and decode via binascii, avoiding
+            # the extra intermediate copy base64.urlsafe_b64decode would make
+            raw = binascii.a2b_base64(
+                data.encode("ascii").translate(_URLSAFE_TRANS) + b"==="
+            )
+            return raw.decode("utf-8", errors="replace")
+
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug("Failed to extract message body: %s", e)
             return "Failed to extract message content" 
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""Shared fixtures for Gmail client tests.
+
+Building a GmailClient plus a Mock service in every setup_method repeats
+the same construction for every test. The session-scoped fixtures here
+build that pair once; the function-scoped `client` wrapper hands each
+test a cleanly reset view of it. gmail_client_impl itself is imported
+lazily inside the fixtures so collecting these files does not pull in
+the googleapiclient discovery machinery.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+# These tests spend their time in mocks, not imports; skip .pyc writes
+sys.dont_write_bytecode = True
+
+try:
+    from pytest_socket import disable_socket
+except ImportError:  # Optional guard; tests still pass without it
+    disable_socket = None
+
+if TYPE_CHECKING:
+    from gmail_client_impl import GmailClient
+
+
+def pytest_runtest_setup() -> None:
+    """Fail fast if a regression slips past the mocks and opens a socket."""
+    if disable_socket is not None:
+        disable_socket()
+
+
+# Only the service attributes the client actually touches; spec stops
+# Mock from auto-creating children for typos and unused names
+_SERVICE_SPEC = ("users", "new_batch_http_request")
+
+
+@pytest.fixture(scope="session")
+def gmail_client_cls() -> type:
+    """Import GmailClient on first use instead of at collection."""
+    from gmail_client_impl import GmailClient
+    return GmailClient
+
+
+@pytest.fixture(scope="session")
+def email_proxy_cls() -> type:
+    """Import EmailMessageProxy on first use instead of at collection."""
+    from gmail_client_impl import EmailMessageProxy
+    return EmailMessageProxy
+
+
+@pytest.fixture(scope="session")
+def gmail_client_mocked(gmail_client_cls: type) -> GmailClient:
+    """Construct a GmailClient with a mocked service once per session.
+
+    Session scope means each pytest-xdist worker pays the construction
+    cost once; the function-scoped `client` wrapper below guarantees
+    per-test isolation regardless.
+    """
+    client = gmail_client_cls()
+    client.service = Mock(spec=_SERVICE_SPEC)
+    # Materialize the users().messages() chain up front so per-test
+    # accesses are plain lookups, never child-mock creation
+    client.service.users.return_value.messages.return_value  # noqa: B018
+    return client
+
+
+@pytest.fixture
+def client(gmail_client_mocked: GmailClient) -> GmailClient:
+    """Return the shared client with mock and cache state cleared."""
+    gmail_client_mocked.service.reset_mock(return_value=True, side_effect=True)
+    gmail_client_mocked._parse_cache.clear()
+    gmail_client_mocked._folders_cache = None
+    return gmail_client_mocked
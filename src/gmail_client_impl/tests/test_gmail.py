@@ -4,31 +4,154 @@ This module contains tests for the GmailClient class, including mocked
 Gmail API interactions and authentication testing.
 """
 
+from __future__ import annotations
+
 import base64
-import json
-import os
-import tempfile
-from datetime import datetime
-from unittest.mock import Mock, MagicMock, patch, mock_open
-from typing import Any, Dict, List
+import copy
+import re
+from functools import reduce
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import ANY, Mock, call, mock_open
+from typing import Any, Dict, List, TYPE_CHECKING
 
 import pytest
-from googleapiclient.errors import HttpError
-
-# Import the classes we need to test
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from gmail_client_impl import GmailClient
 from email_client_api import EmailMessage, AuthenticationError, EmailClientError
 
+if TYPE_CHECKING:
+    from gmail_client_impl import GmailClient
+
+
+def _set_return(mock: Mock, dotted: str, val: Any) -> None:
+    """Set return_value at the end of a dotted mock attribute path.
+
+    Walking the path with getattr touches plain attributes only, so no
+    calls are recorded on the way to the leaf.
+    """
+    reduce(getattr, dotted.split("."), mock).return_value = val
+
+
+# pytest.raises(match=...) re-compiles string patterns on every use;
+# these are compiled once and accepted as-is
+_ERR_NOT_AUTH = re.compile("Not authenticated")
+_ERR_CREDS = re.compile("Credentials file not found")
+_ERR_BAD_RECIPIENT = re.compile("Invalid recipient address")
+
+# Prototype HTTP response mocks; tests copy.copy() these instead of
+# rebuilding a Mock per test, which is materially cheaper
+_HTTP_RESP_400 = Mock(status=400)
+_HTTP_RESP_404 = Mock(status=404)
+
+# One mock_open tree for every auth test; reset per test by auth_patches
+_OPEN_MOCK = mock_open()
+
+# Base64 payloads and message dicts encoded once at import instead of
+# per test run
+_B64_TEST_BODY = base64.urlsafe_b64encode(b"Test body content").decode()
+_B64_UNREAD = base64.urlsafe_b64encode(b"Unread content").decode()
+_B64_PLAIN = base64.urlsafe_b64encode(b"Plain text part").decode()
+_B64_HTML = base64.urlsafe_b64encode(b"<html>HTML part</html>").decode()
+_B64_LAZY = base64.urlsafe_b64encode(b"Lazy body").decode()
+
+_LAZY_MSG = MappingProxyType({
+    "id": "lazy_msg",
+    "internalDate": "1640995200000",
+    "labelIds": ["INBOX"],
+    "payload": {
+        "headers": [
+            {"name": "Subject", "value": "Lazy Subject"},
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+        ],
+        "mimeType": "text/plain",
+        "body": {"data": _B64_LAZY}
+    }
+})
+
+_SIMPLE_MSG = MappingProxyType({
+    "id": "test_msg_123",
+    "internalDate": "1640995200000",  # 2022-01-01 00:00:00
+    "labelIds": ["INBOX"],
+    "payload": {
+        "headers": [
+            {"name": "Subject", "value": "Test Subject"},
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+        ],
+        "mimeType": "text/plain",
+        "body": {"data": _B64_TEST_BODY}
+    }
+})
+
+_UNREAD_MSG = MappingProxyType({
+    "id": "unread_msg",
+    "internalDate": "1640995200000",
+    "labelIds": ["INBOX", "UNREAD"],
+    "payload": {
+        "headers": [
+            {"name": "Subject", "value": "Unread Subject"},
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+        ],
+        "mimeType": "text/plain",
+        "body": {"data": _B64_UNREAD}
+    }
+})
+
+def _make_gmail_message(email_id: str) -> Dict[str, Any]:
+    """Create a mock Gmail API message keyed by ID."""
+    return {
+        "id": email_id,
+        "internalDate": "1640995200000",  # 2022-01-01 00:00:00
+        "labelIds": ["INBOX", "UNREAD"],
+        "payload": {
+            "headers": [
+                {"name": "Subject", "value": f"Test Subject {email_id}"},
+                {"name": "From", "value": f"sender{email_id}@example.com"},
+                {"name": "To", "value": f"recipient{email_id}@example.com"},
+            ],
+            "mimeType": "text/plain",
+            "body": {
+                "data": base64.urlsafe_b64encode(
+                    f"Test body content {email_id}".encode()
+                ).decode()
+            }
+        }
+    }
+
+
+# Built once, along with ready-made get() response wrappers; a
+# side_effect list of these costs nothing per call, where building two
+# Mocks inside each test (or a lambda) would
+_MSG1 = MappingProxyType(_make_gmail_message("msg1"))
+_MSG2 = MappingProxyType(_make_gmail_message("msg2"))
+_GET_RESP1 = Mock(execute=Mock(return_value=_MSG1))
+_GET_RESP2 = Mock(execute=Mock(return_value=_MSG2))
+
+_MULTIPART_MSG = MappingProxyType({
+    "id": "multipart_msg",
+    "internalDate": "1640995200000",
+    "labelIds": ["INBOX"],
+    "payload": {
+        "headers": [
+            {"name": "Subject", "value": "Multipart Subject"},
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+        ],
+        "parts": [
+            {"mimeType": "text/plain", "body": {"data": _B64_PLAIN}},
+            {"mimeType": "text/html", "body": {"data": _B64_HTML}},
+        ]
+    }
+})
+
 
 class TestGmailClientInitialization:
     """Test cases for GmailClient initialization."""
     
-    def test_init_with_defaults(self) -> None:
+    def test_init_with_defaults(self, gmail_client_cls: type) -> None:
         """Test GmailClient initialization with default parameters."""
-        client = GmailClient()
+        client = gmail_client_cls()
         
         assert client.credentials_file == "credentials.json"
         assert client.token_file == "token.json"
@@ -36,11 +159,11 @@ class TestGmailClientInitialization:
         assert client.credentials is None
         assert len(client.scopes) == 3  # Default scopes
     
-    def test_init_with_custom_params(self) -> None:
+    def test_init_with_custom_params(self, gmail_client_cls: type) -> None:
         """Test GmailClient initialization with custom parameters."""
         custom_scopes = ["https://www.googleapis.com/auth/gmail.readonly"]
         
-        client = GmailClient(
+        client = gmail_client_cls(
             credentials_file="custom_creds.json",
             token_file="custom_token.json",
             scopes=custom_scopes
@@ -51,180 +174,239 @@ class TestGmailClientInitialization:
         assert client.scopes == custom_scopes
 
 
+@pytest.fixture
+def auth_patches(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Patch the Google auth entry points via monkeypatch's undo stack.
+
+    monkeypatch.setattr pushes each target onto one undo stack that
+    pytest finalizes, skipping the per-target __enter__/__exit__
+    machinery a stack of unittest.mock patchers would run.
+    """
+    patches = SimpleNamespace(
+        build=Mock(),
+        flow=Mock(),
+        from_file=Mock(),
+        exists=Mock(),
+        open=_OPEN_MOCK,
+    )
+    monkeypatch.setattr("gmail_client_impl.build", patches.build)
+    monkeypatch.setattr(
+        "gmail_client_impl.InstalledAppFlow.from_client_secrets_file", patches.flow
+    )
+    monkeypatch.setattr(
+        "gmail_client_impl.Credentials.from_authorized_user_file", patches.from_file
+    )
+    monkeypatch.setattr("os.path.exists", patches.exists)
+    monkeypatch.setattr("builtins.open", _OPEN_MOCK)
+    _OPEN_MOCK.reset_mock()
+    return patches
+
+
 class TestGmailClientAuthentication:
     """Test cases for Gmail authentication."""
-    
-    @patch('gmail_client_impl.build')
-    @patch('gmail_client_impl.InstalledAppFlow.from_client_secrets_file')
-    @patch('os.path.exists')
-    def test_authenticate_new_user(
-        self, 
-        mock_exists: Mock, 
-        mock_flow: Mock, 
-        mock_build: Mock
-    ) -> None:
+
+    def test_authenticate_new_user(self, auth_patches: Any, gmail_client_cls: type) -> None:
         """Test authentication for a new user without existing token."""
         # Setup mocks
-        mock_exists.side_effect = lambda path: path == "credentials.json"
+        auth_patches.exists.side_effect = lambda path: path == "credentials.json"
         mock_credentials = Mock()
         mock_credentials.to_json.return_value = '{"token": "test"}'
         mock_flow_instance = Mock()
         mock_flow_instance.run_local_server.return_value = mock_credentials
-        mock_flow.return_value = mock_flow_instance
+        auth_patches.flow.return_value = mock_flow_instance
         mock_service = Mock()
-        mock_build.return_value = mock_service
-        
-        client = GmailClient()
-        
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = client.authenticate()
-        
+        auth_patches.build.return_value = mock_service
+
+        client = gmail_client_cls()
+        result = client.authenticate()
+
         assert result is True
         assert client.credentials == mock_credentials
         assert client.service == mock_service
-        mock_flow.assert_called_once()
-        mock_file.assert_called_once_with("token.json", "w", encoding="utf-8")
-    
-    @patch('gmail_client_impl.build')
-    @patch('gmail_client_impl.Credentials.from_authorized_user_file')
-    @patch('os.path.exists')
-    def test_authenticate_existing_valid_token(
-        self, 
-        mock_exists: Mock, 
-        mock_from_file: Mock, 
-        mock_build: Mock
-    ) -> None:
+        auth_patches.flow.assert_called_once()
+        auth_patches.open.assert_called_once_with("token.json", "w", encoding="utf-8")
+
+    def test_authenticate_existing_valid_token(self, auth_patches: Any, gmail_client_cls: type) -> None:
         """Test authentication with existing valid token."""
         # Setup mocks
-        mock_exists.return_value = True
+        auth_patches.exists.return_value = True
         mock_credentials = Mock()
         mock_credentials.valid = True
-        mock_from_file.return_value = mock_credentials
+        auth_patches.from_file.return_value = mock_credentials
         mock_service = Mock()
-        mock_build.return_value = mock_service
-        
-        client = GmailClient()
+        auth_patches.build.return_value = mock_service
+
+        client = gmail_client_cls()
         result = client.authenticate()
-        
+
         assert result is True
         assert client.credentials == mock_credentials
         assert client.service == mock_service
-        mock_from_file.assert_called_once_with("token.json", client.scopes)
-    
-    @patch('gmail_client_impl.build')
-    @patch('gmail_client_impl.Credentials.from_authorized_user_file')
-    @patch('gmail_client_impl.Request')
-    @patch('os.path.exists')
-    def test_authenticate_refresh_expired_token(
-        self, 
-        mock_exists: Mock, 
-        mock_request: Mock, 
-        mock_from_file: Mock, 
-        mock_build: Mock
-    ) -> None:
+        auth_patches.from_file.assert_called_once_with("token.json", client.scopes)
+
+    def test_authenticate_refresh_expired_token(self, auth_patches: Any, gmail_client_cls: type) -> None:
         """Test authentication with expired token that can be refreshed."""
         # Setup mocks
-        mock_exists.return_value = True
+        auth_patches.exists.return_value = True
         mock_credentials = Mock()
         mock_credentials.valid = False
         mock_credentials.expired = True
         mock_credentials.refresh_token = "refresh_token"
         mock_credentials.to_json.return_value = '{"token": "refreshed"}'
-        mock_from_file.return_value = mock_credentials
+        auth_patches.from_file.return_value = mock_credentials
         mock_service = Mock()
-        mock_build.return_value = mock_service
-        
-        client = GmailClient()
-        
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = client.authenticate()
-        
+        auth_patches.build.return_value = mock_service
+
+        client = gmail_client_cls()
+        result = client.authenticate()
+
         assert result is True
         mock_credentials.refresh.assert_called_once()
-        mock_file.assert_called_once_with("token.json", "w", encoding="utf-8")
-    
-    @patch('os.path.exists')
-    def test_authenticate_missing_credentials_file(self, mock_exists: Mock) -> None:
+        auth_patches.open.assert_called_once_with("token.json", "w", encoding="utf-8")
+
+    def test_authenticate_missing_credentials_file(self, auth_patches: Any, gmail_client_cls: type) -> None:
         """Test authentication fails when credentials file is missing."""
-        mock_exists.return_value = False
-        
-        client = GmailClient()
-        
-        with pytest.raises(AuthenticationError, match="Credentials file not found"):
+        auth_patches.exists.return_value = False
+
+        client = gmail_client_cls()
+
+        with pytest.raises(AuthenticationError, match=_ERR_CREDS):
             client.authenticate()
 
 
-class TestGmailClientSendEmail:
+class _MockedServiceBase:
+    """Binds the shared mocked client from conftest onto each test.
+
+    self.msgs points at the users().messages() resource mock so tests
+    wire and assert operations without re-walking the chain themselves.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _client(self, client: GmailClient) -> None:
+        """Bind the shared mocked client to this test."""
+        self.client = client
+        self.msgs = client.service.users.return_value.messages.return_value
+
+
+class TestGmailClientSendEmail(_MockedServiceBase):
     """Test cases for sending emails."""
-    
-    def setup_method(self) -> None:
-        """Set up test client with mocked service."""
-        self.client = GmailClient()
-        self.client.service = Mock()
-    
+
     def test_send_email_success(self) -> None:
         """Test successful email sending."""
-        # Setup mock
+        # Setup mock; .return_value avoids calling the mock chain, which
+        # would record calls and skew the assertion below
         mock_result = {"id": "sent_message_id_123"}
-        self.client.service.users().messages().send().execute.return_value = mock_result
-        
+        self.msgs.send.return_value.execute.return_value = mock_result
+
         result = self.client.send_email(
             recipient="test@example.com",
             subject="Test Subject",
             body="Test Body"
         )
-        
+
         assert result is True
-        self.client.service.users().messages().send.assert_called_once()
+        assert self.msgs.send.call_count == 1
+        assert self.msgs.send.call_args == call(userId="me", body={"raw": ANY})
     
-    def test_send_email_not_authenticated(self) -> None:
+    def test_send_email_not_authenticated(self, gmail_client_cls: type) -> None:
         """Test sending email without authentication."""
-        client = GmailClient()  # No service set
+        client = gmail_client_cls()  # No service set
         
-        with pytest.raises(AuthenticationError, match="Not authenticated"):
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
             client.send_email("test@example.com", "Subject", "Body")
     
-    def test_send_email_http_error(self) -> None:
-        """Test sending email with HTTP error."""
-        # Setup mock to raise HttpError
-        mock_response = Mock()
-        mock_response.status = 400
-        http_error = HttpError(mock_response, b'{"error": "Bad Request"}')
-        self.client.service.users().messages().send().execute.side_effect = http_error
-        
-        with pytest.raises(EmailClientError, match="Failed to send email"):
-            self.client.send_email("test@example.com", "Subject", "Body")
+    def test_send_email_invalid_recipient(self) -> None:
+        """Test sending email to a malformed address fails fast."""
+        with pytest.raises(EmailClientError, match=_ERR_BAD_RECIPIENT):
+            self.client.send_email("not-an-address", "Subject", "Body")
+
+        self.msgs.send.return_value.execute.assert_not_called()
+
+@pytest.fixture(scope="session")
+def http_error_cls() -> Any:
+    """Import HttpError only for the tests that construct one.
+
+    Keeping googleapiclient.errors out of the module's top-level imports
+    means collecting this file does not pull in the discovery machinery.
+    """
+    from googleapiclient.errors import HttpError
+    return HttpError
+
+
+class TestGmailClientHttpErrors(_MockedServiceBase):
+    """Parametrized HTTP-error handling across operations."""
+
+    @pytest.mark.parametrize(
+        ("op", "args", "verb", "response", "expected"),
+        [
+            (
+                "send_email",
+                ("test@example.com", "Subject", "Body"),
+                "send",
+                _HTTP_RESP_400,
+                "raises",
+            ),
+            ("delete_email", ("nonexistent_id",), "delete", _HTTP_RESP_404, False),
+            ("mark_as_read", ("nonexistent_id",), "modify", _HTTP_RESP_404, False),
+            ("retrieve_emails", (), "list", _HTTP_RESP_400, "raises"),
+        ],
+    )
+    def test_http_error(
+        self, op: str, args: tuple, verb: str, response: Mock, expected: Any,
+        http_error_cls: Any
+    ) -> None:
+        """Test each operation's handling of an API HttpError."""
+        http_error = http_error_cls(copy.copy(response), b'{"error": "x"}')
+        getattr(self.msgs, verb).return_value.execute.side_effect = http_error
 
+        if expected == "raises":
+            with pytest.raises(EmailClientError):
+                getattr(self.client, op)(*args)
+        else:
+            assert getattr(self.client, op)(*args) is expected
 
-class TestGmailClientRetrieveEmails:
+
+class _FakeBatchRequest:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest.
+
+    Executes queued requests serially and routes results (or exceptions)
+    through the callback, mirroring the real batch endpoint's contract.
+    """
+
+    def __init__(self, callback: Any) -> None:
+        self._callback = callback
+        self._requests: List[Any] = []
+
+    def add(self, request: Any, request_id: str = None) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self._requests:
+            try:
+                self._callback(request_id, request.execute(), None)
+            except Exception as e:
+                self._callback(request_id, None, e)
+
+
+class _BatchServiceBase(_MockedServiceBase):
+    """Adds the fake batch endpoint on top of the shared mocked client."""
+
+    @pytest.fixture(autouse=True)
+    def _client(self, client: GmailClient) -> None:
+        """Bind the shared mocked client and wire the fake batch endpoint."""
+        self.client = client
+        self.msgs = client.service.users.return_value.messages.return_value
+        # configure_mock resolves the dotted path in one call, and the
+        # class itself is the factory: side_effect calls it with the
+        # callback argument, no per-test lambda needed
+        self.client.service.configure_mock(
+            **{"new_batch_http_request.side_effect": _FakeBatchRequest}
+        )
+
+
+class TestGmailClientRetrieveEmails(_BatchServiceBase):
     """Test cases for retrieving emails."""
-    
-    def setup_method(self) -> None:
-        """Set up test client with mocked service."""
-        self.client = GmailClient()
-        self.client.service = Mock()
-    
-    def create_mock_gmail_message(self, email_id: str) -> Dict[str, Any]:
-        """Create a mock Gmail API message."""
-        return {
-            "id": email_id,
-            "internalDate": "1640995200000",  # 2022-01-01 00:00:00
-            "labelIds": ["INBOX", "UNREAD"],
-            "payload": {
-                "headers": [
-                    {"name": "Subject", "value": f"Test Subject {email_id}"},
-                    {"name": "From", "value": f"sender{email_id}@example.com"},
-                    {"name": "To", "value": f"recipient{email_id}@example.com"},
-                ],
-                "mimeType": "text/plain",
-                "body": {
-                    "data": base64.urlsafe_b64encode(
-                        f"Test body content {email_id}".encode()
-                    ).decode()
-                }
-            }
-        }
-    
+
     def test_retrieve_emails_success(self) -> None:
         """Test successful email retrieval."""
         # Setup mocks
@@ -234,13 +416,10 @@ class TestGmailClientRetrieveEmails:
                 {"id": "msg2"}
             ]
         }
-        self.client.service.users().messages().list().execute.return_value = mock_messages_list
-        
+        self.msgs.list.return_value.execute.return_value = mock_messages_list
+
         # Mock individual message retrieval
-        self.client.service.users().messages().get.side_effect = [
-            MagicMock(execute=lambda: self.create_mock_gmail_message("msg1")),
-            MagicMock(execute=lambda: self.create_mock_gmail_message("msg2"))
-        ]
+        self.msgs.get.side_effect = [_GET_RESP1, _GET_RESP2]
         
         emails = self.client.retrieve_emails(folder="INBOX", limit=2)
         
@@ -251,198 +430,316 @@ class TestGmailClientRetrieveEmails:
         assert emails[0].subject == "Test Subject msg1"
         assert emails[0].sender == "sendermsg1@example.com"
     
-    def test_retrieve_emails_not_authenticated(self) -> None:
+    def test_retrieve_emails_paginates(self) -> None:
+        """Test retrieval follows nextPageToken across list() pages."""
+        self.msgs.list.return_value.execute.side_effect = [
+            {"messages": [{"id": "msg1"}], "nextPageToken": "page2"},
+            {"messages": [{"id": "msg2"}]},
+        ]
+        self.msgs.get.side_effect = [_GET_RESP1, _GET_RESP2]
+
+        emails = self.client.retrieve_emails(limit=2)
+
+        assert [email.id for email in emails] == ["msg1", "msg2"]
+
+    def test_retrieve_emails_full_bodies_in_parallel(self) -> None:
+        """Test fetch_body=True retrieves full messages via the thread pool."""
+        mock_messages_list = {"messages": [{"id": "msg1"}, {"id": "msg2"}]}
+        self.msgs.list.return_value.execute.return_value = mock_messages_list
+        self.msgs.get.side_effect = [_GET_RESP1, _GET_RESP2]
+
+        emails = self.client.retrieve_emails(limit=2, fetch_body=True)
+
+        assert len(emails) == 2
+        # Completion order is not guaranteed on the parallel path
+        assert {email.body for email in emails} == {
+            "Test body content msg1",
+            "Test body content msg2",
+        }
+
+    def test_retrieve_emails_metadata_only(self) -> None:
+        """Test retrieval without body extraction via fetch_body=False."""
+        mock_messages_list = {"messages": [{"id": "msg1"}]}
+        self.msgs.list.return_value.execute.return_value = mock_messages_list
+        self.msgs.get.side_effect = [_GET_RESP1]
+
+        emails = self.client.retrieve_emails(limit=1, fetch_body=False)
+
+        assert len(emails) == 1
+        assert emails[0].subject == "Test Subject msg1"
+        assert emails[0].sender == "sendermsg1@example.com"
+        assert emails[0].body == ""
+
+    def test_retrieve_emails_not_authenticated(self, gmail_client_cls: type) -> None:
         """Test retrieving emails without authentication."""
-        client = GmailClient()  # No service set
+        client = gmail_client_cls()  # No service set
         
-        with pytest.raises(AuthenticationError, match="Not authenticated"):
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
             client.retrieve_emails()
     
     def test_retrieve_emails_empty_result(self) -> None:
         """Test retrieving emails when none exist."""
         mock_messages_list = {"messages": []}
-        self.client.service.users().messages().list().execute.return_value = mock_messages_list
-        
+        self.msgs.list.return_value.execute.return_value = mock_messages_list
+
         emails = self.client.retrieve_emails()
         
         assert emails == []
 
 
-class TestGmailClientDeleteEmail:
+class TestGmailClientSearchMessages(_BatchServiceBase):
+    """Test cases for searching messages."""
+
+    def test_search_messages_streams_results(self) -> None:
+        """Test search yields parsed messages as batches complete."""
+        mock_messages_list = {"messages": [{"id": "msg1"}, {"id": "msg2"}]}
+        self.msgs.list.return_value.execute.return_value = mock_messages_list
+        self.msgs.get.side_effect = [_GET_RESP1, _GET_RESP2]
+
+        emails = list(self.client.search_messages("subject:Test", limit=2))
+
+        assert len(emails) == 2
+        assert all(isinstance(email, EmailMessage) for email in emails)
+        assert emails[0].subject == "Test Subject msg1"
+        assert emails[1].subject == "Test Subject msg2"
+
+    def test_search_messages_not_authenticated(self, gmail_client_cls: type) -> None:
+        """Test searching messages without authentication."""
+        client = gmail_client_cls()  # No service set
+
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
+            list(client.search_messages("subject:Test"))
+
+
+class TestEmailMessageProxy(_MockedServiceBase):
+    """Test cases for lazy email message proxies."""
+
+    def test_lazy_retrieve_skips_message_fetch(self, email_proxy_cls: type) -> None:
+        """Test lazy retrieval returns proxies without per-message get calls."""
+        mock_messages_list = {"messages": [{"id": "msg1"}, {"id": "msg2"}]}
+        _set_return(
+            self.client.service,
+            "users.return_value.messages.return_value.list.return_value.execute",
+            mock_messages_list,
+        )
+
+        emails = self.client.retrieve_emails(limit=2, lazy=True)
+
+        assert len(emails) == 2
+        assert all(isinstance(email, email_proxy_cls) for email in emails)
+        assert emails[0].id == "msg1"
+        assert emails[1].id == "msg2"
+        self.msgs.get.assert_not_called()
+
+    def test_proxy_fetches_on_attribute_access(self, email_proxy_cls: type) -> None:
+        """Test proxy fetches the full message on first attribute access."""
+        _set_return(
+            self.client.service,
+            "users.return_value.messages.return_value.get.return_value.execute",
+            _LAZY_MSG,
+        )
+
+        proxy = email_proxy_cls(self.client, "lazy_msg")
+
+        assert proxy.subject == "Lazy Subject"
+        assert proxy.body == "Lazy body"
+        # Second access reuses the cached message instead of refetching
+        assert self.msgs.get.return_value.execute.call_count == 1
+
+
+class TestGmailClientDeleteEmail(_MockedServiceBase):
     """Test cases for deleting emails."""
-    
-    def setup_method(self) -> None:
-        """Set up test client with mocked service."""
-        self.client = GmailClient()
-        self.client.service = Mock()
-    
+
     def test_delete_email_success(self) -> None:
         """Test successful email deletion."""
-        self.client.service.users().messages().delete().execute.return_value = {}
-        
+        self.msgs.delete.return_value.execute.return_value = {}
+
         result = self.client.delete_email("test_email_id")
-        
+
         assert result is True
-        self.client.service.users().messages().delete.assert_called_once_with(
-            userId="me", id="test_email_id"
-        )
-    
-    def test_delete_email_not_found(self) -> None:
-        """Test deleting non-existent email."""
-        mock_response = Mock()
-        mock_response.status = 404
-        http_error = HttpError(mock_response, b'{"error": "Not Found"}')
-        self.client.service.users().messages().delete().execute.side_effect = http_error
-        
-        result = self.client.delete_email("nonexistent_id")
-        
-        assert result is False
+        assert self.msgs.delete.call_count == 1
+        assert self.msgs.delete.call_args == call(userId="me", id="test_email_id")
     
-    def test_delete_email_not_authenticated(self) -> None:
+    def test_delete_email_not_authenticated(self, gmail_client_cls: type) -> None:
         """Test deleting email without authentication."""
-        client = GmailClient()  # No service set
+        client = gmail_client_cls()  # No service set
         
-        with pytest.raises(AuthenticationError, match="Not authenticated"):
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
             client.delete_email("test_id")
 
 
-class TestGmailClientMarkAsRead:
+class TestGmailClientMarkAsRead(_MockedServiceBase):
     """Test cases for marking emails as read."""
-    
-    def setup_method(self) -> None:
-        """Set up test client with mocked service."""
-        self.client = GmailClient()
-        self.client.service = Mock()
-    
+
     def test_mark_as_read_success(self) -> None:
         """Test successfully marking email as read."""
-        self.client.service.users().messages().modify().execute.return_value = {}
-        
+        self.msgs.modify.return_value.execute.return_value = {}
+
         result = self.client.mark_as_read("test_email_id")
-        
+
         assert result is True
-        self.client.service.users().messages().modify.assert_called_once_with(
+        assert self.msgs.modify.call_count == 1
+        assert self.msgs.modify.call_args == call(
             userId="me",
             id="test_email_id",
             body={"removeLabelIds": ["UNREAD"]}
         )
     
-    def test_mark_as_read_not_found(self) -> None:
-        """Test marking non-existent email as read."""
-        mock_response = Mock()
-        mock_response.status = 404
-        http_error = HttpError(mock_response, b'{"error": "Not Found"}')
-        self.client.service.users().messages().modify().execute.side_effect = http_error
-        
-        result = self.client.mark_as_read("nonexistent_id")
-        
-        assert result is False
-    
-    def test_mark_as_read_not_authenticated(self) -> None:
+    def test_mark_as_read_not_authenticated(self, gmail_client_cls: type) -> None:
         """Test marking email as read without authentication."""
-        client = GmailClient()  # No service set
+        client = gmail_client_cls()  # No service set
         
-        with pytest.raises(AuthenticationError, match="Not authenticated"):
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
             client.mark_as_read("test_id")
 
 
+class TestGmailClientBulkOperations(_MockedServiceBase):
+    """Test cases for bulk delete and mark-as-read."""
+
+    def test_delete_emails_single_request(self) -> None:
+        """Test bulk deletion issues one batchDelete call for small inputs."""
+        self.msgs.batchDelete.return_value.execute.return_value = {}
+
+        result = self.client.delete_emails(["id1", "id2", "id3"])
+
+        assert result is True
+        self.msgs.batchDelete.assert_called_once_with(
+            userId="me", body={"ids": ["id1", "id2", "id3"]}
+        )
+
+    def test_delete_emails_chunks_large_inputs(self) -> None:
+        """Test bulk deletion splits inputs above the 1000-ID API cap."""
+        self.msgs.batchDelete.return_value.execute.return_value = {}
+
+        result = self.client.delete_emails([f"id{i}" for i in range(1500)])
+
+        assert result is True
+        assert self.msgs.batchDelete.call_count == 2
+
+    def test_mark_as_read_bulk_success(self) -> None:
+        """Test bulk mark-as-read issues one batchModify call."""
+        self.msgs.batchModify.return_value.execute.return_value = {}
+
+        result = self.client.mark_as_read_bulk(["id1", "id2"])
+
+        assert result is True
+        self.msgs.batchModify.assert_called_once_with(
+            userId="me",
+            body={"ids": ["id1", "id2"], "removeLabelIds": ["UNREAD"]}
+        )
+
+    def test_delete_emails_not_authenticated(self, gmail_client_cls: type) -> None:
+        """Test bulk deletion without authentication."""
+        client = gmail_client_cls()  # No service set
+
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
+            client.delete_emails(["id1"])
+
+
+class TestGmailClientGetFolders(_MockedServiceBase):
+    """Test cases for listing folders."""
+
+    def test_get_folders_success(self) -> None:
+        """Test successful folder listing."""
+        mock_labels = {"labels": [{"name": "INBOX"}, {"name": "Receipts"}]}
+        _set_return(
+            self.client.service,
+            "users.return_value.labels.return_value.list.return_value.execute",
+            mock_labels,
+        )
+
+        folders = self.client.get_folders()
+
+        assert folders == ["INBOX", "Receipts"]
+
+    def test_get_folders_cached(self) -> None:
+        """Test repeated calls within the TTL reuse the cached labels."""
+        mock_labels = {"labels": [{"name": "INBOX"}]}
+        _set_return(
+            self.client.service,
+            "users.return_value.labels.return_value.list.return_value.execute",
+            mock_labels,
+        )
+
+        first = self.client.get_folders()
+        second = self.client.get_folders()
+
+        assert first == second == ["INBOX"]
+        labels = self.client.service.users.return_value.labels.return_value
+        assert labels.list.return_value.execute.call_count == 1
+
+    def test_get_folders_not_authenticated(self, gmail_client_cls: type) -> None:
+        """Test listing folders without authentication."""
+        client = gmail_client_cls()  # No service set
+
+        with pytest.raises(AuthenticationError, match=_ERR_NOT_AUTH):
+            client.get_folders()
+
+
+@pytest.fixture(scope="module")
+def parser(gmail_client_cls: type) -> Any:
+    """Bind _parse_gmail_message on one throwaway client for the module.
+
+    Parsing never touches the service or credentials, so the parse tests
+    do not need the shared mocked client, only this bound method.
+    """
+    return gmail_client_cls()._parse_gmail_message
+
+
 class TestGmailClientMessageParsing:
     """Test cases for Gmail message parsing."""
-    
-    def setup_method(self) -> None:
-        """Set up test client."""
-        self.client = GmailClient()
-    
-    def test_parse_gmail_message_simple(self) -> None:
-        """Test parsing a simple Gmail message."""
-        mock_msg = {
-            "id": "test_msg_123",
-            "internalDate": "1640995200000",  # 2022-01-01 00:00:00
-            "labelIds": ["INBOX"],
-            "payload": {
-                "headers": [
-                    {"name": "Subject", "value": "Test Subject"},
-                    {"name": "From", "value": "sender@example.com"},
-                    {"name": "To", "value": "recipient@example.com"},
-                ],
-                "mimeType": "text/plain",
-                "body": {
-                    "data": base64.urlsafe_b64encode(b"Test body content").decode()
-                }
-            }
-        }
-        
-        email = self.client._parse_gmail_message(mock_msg)
-        
-        assert email is not None
-        assert email.id == "test_msg_123"
-        assert email.subject == "Test Subject"
-        assert email.sender == "sender@example.com"
-        assert email.recipient == "recipient@example.com"
-        assert email.body == "Test body content"
-        assert email.is_read is True  # No UNREAD label
-        assert email.folder == "INBOX"
-    
-    def test_parse_gmail_message_unread(self) -> None:
-        """Test parsing an unread Gmail message."""
-        mock_msg = {
-            "id": "unread_msg",
-            "internalDate": "1640995200000",
-            "labelIds": ["INBOX", "UNREAD"],
-            "payload": {
-                "headers": [
-                    {"name": "Subject", "value": "Unread Subject"},
-                    {"name": "From", "value": "sender@example.com"},
-                    {"name": "To", "value": "recipient@example.com"},
-                ],
-                "mimeType": "text/plain",
-                "body": {"data": base64.urlsafe_b64encode(b"Unread content").decode()}
-            }
-        }
-        
-        email = self.client._parse_gmail_message(mock_msg)
-        
+
+    @pytest.mark.parametrize(
+        ("msg", "attr", "want"),
+        [
+            (_SIMPLE_MSG, "id", "test_msg_123"),
+            (_SIMPLE_MSG, "subject", "Test Subject"),
+            (_SIMPLE_MSG, "sender", "sender@example.com"),
+            (_SIMPLE_MSG, "recipient", "recipient@example.com"),
+            (_SIMPLE_MSG, "body", "Test body content"),
+            (_SIMPLE_MSG, "is_read", True),  # No UNREAD label
+            (_SIMPLE_MSG, "folder", "INBOX"),
+            (_UNREAD_MSG, "is_read", False),  # UNREAD label present
+            (_MULTIPART_MSG, "body", "Plain text part"),  # Extracts plain text
+        ],
+    )
+    def test_parse_gmail_message(
+        self, parser: Any, msg: Dict[str, Any], attr: str, want: Any
+    ) -> None:
+        """Test parsed field values across message shapes."""
+        email = parser(msg)
+
         assert email is not None
-        assert email.is_read is False  # UNREAD label present
-    
-    def test_parse_gmail_message_multipart(self) -> None:
-        """Test parsing a multipart Gmail message."""
+        assert getattr(email, attr) == want
+
+    def test_parse_gmail_message_cached_by_history_id(self, parser: Any) -> None:
+        """Test repeated parses of an unchanged message hit the cache."""
         mock_msg = {
-            "id": "multipart_msg",
+            "id": "cached_msg",
+            "historyId": "12345",
             "internalDate": "1640995200000",
             "labelIds": ["INBOX"],
             "payload": {
                 "headers": [
-                    {"name": "Subject", "value": "Multipart Subject"},
+                    {"name": "Subject", "value": "Cached Subject"},
                     {"name": "From", "value": "sender@example.com"},
                     {"name": "To", "value": "recipient@example.com"},
                 ],
-                "parts": [
-                    {
-                        "mimeType": "text/plain",
-                        "body": {
-                            "data": base64.urlsafe_b64encode(b"Plain text part").decode()
-                        }
-                    },
-                    {
-                        "mimeType": "text/html",
-                        "body": {
-                            "data": base64.urlsafe_b64encode(b"<html>HTML part</html>").decode()
-                        }
-                    }
-                ]
+                "mimeType": "text/plain",
+                "body": {"data": base64.urlsafe_b64encode(b"Cached body").decode()}
             }
         }
-        
-        email = self.client._parse_gmail_message(mock_msg)
-        
-        assert email is not None
-        assert email.body == "Plain text part"  # Should extract plain text
-    
-    def test_parse_gmail_message_invalid(self) -> None:
+
+        first = parser(mock_msg)
+        second = parser(mock_msg)
+
+        assert first is not None
+        assert second is first  # Same object, not a re-parse
+
+    def test_parse_gmail_message_invalid(self, parser: Any) -> None:
         """Test parsing an invalid Gmail message."""
         invalid_msg = {"id": "invalid"}  # Missing required fields
         
-        email = self.client._parse_gmail_message(invalid_msg)
+        email = parser(invalid_msg)
         
         assert email is None 
\ No newline at end of file